@@ -20,11 +20,28 @@ class CollectReview(pyblish.api.InstancePlugin,
     hosts = ['max']
     families = ["review"]
 
+    # Keys of viewport display attributes
+    dsp_keys = (
+        "dspGeometry",
+        "dspShapes",
+        "dspLights",
+        "dspCameras",
+        "dspHelpers",
+        "dspParticles",
+        "dspBones",
+        "dspBkg",
+        "dspGrid",
+        "dspSafeFrame",
+        "dspFrameNums",
+    )
+
     def process(self, instance):
         nodes = instance.data["members"]
+        # Query camera classes only once for all nodes
+        camera_classes = tuple(rt.Camera.classes)
 
         def is_camera(node):
-            is_camera_class = rt.classOf(node) in rt.Camera.classes
+            is_camera_class = rt.classOf(node) in camera_classes
             return is_camera_class and rt.isProperty(node, "fov")
 
         # Use first camera in instance
@@ -73,18 +90,11 @@ class CollectReview(pyblish.api.InstancePlugin,
                 "vpStyle": creator_attrs["visualStyleMode"],
                 "vpPreset": creator_attrs["viewportPreset"],
                 "vpTextures": creator_attrs["vpTexture"],
-                "dspGeometry": attr_values.get("dspGeometry"),
-                "dspShapes": attr_values.get("dspShapes"),
-                "dspLights": attr_values.get("dspLights"),
-                "dspCameras": attr_values.get("dspCameras"),
-                "dspHelpers": attr_values.get("dspHelpers"),
-                "dspParticles": attr_values.get("dspParticles"),
-                "dspBones": attr_values.get("dspBones"),
-                "dspBkg": attr_values.get("dspBkg"),
-                "dspGrid": attr_values.get("dspGrid"),
-                "dspSafeFrame": attr_values.get("dspSafeFrame"),
-                "dspFrameNums": attr_values.get("dspFrameNums")
             }
+            preview_data.update({
+                key: attr_values.get(key)
+                for key in self.dsp_keys
+            })
         else:
             general_viewport = {
                 "dspBkg": attr_values.get("dspBkg"),
@@ -216,6 +216,10 @@ class EventCallback(object):
         self._name = name
         self._path = path
 
+        # Reference to event system which owns the callback, it is notified
+        #   when order of the callback changes
+        self._event_system_ref = None
+
     def __repr__(self):
         return "< {} - {} > {}".format(
             self.__class__.__name__, self._name, self._path
@@ -293,6 +297,11 @@ class EventCallback(object):
 
         self._validate_order(order)
         self._order = order
+        event_system = None
+        if self._event_system_ref is not None:
+            event_system = self._event_system_ref()
+        if event_system is not None:
+            event_system._invalidate_callbacks_cache()
 
     order = property(get_order, set_order)
 
@@ -315,6 +324,19 @@ class EventCallback(object):
             event(Event): Event that was triggered.
         """
 
+        if self.topic_matches(event.topic):
+            self._process_matched_event(event)
+
+    def _set_event_system(self, event_system):
+        self._event_system_ref = weakref.ref(event_system)
+
+    def _process_matched_event(self, event):
+        """Process event which is known to match callback's topic.
+
+        Args:
+            event(Event): Event that was triggered.
+        """
+
         # Skip if callback is not enabled
         if not self._enabled:
             return
@@ -324,9 +346,6 @@ class EventCallback(object):
         if callback is None:
             return
 
-        if not self.topic_matches(event.topic):
-            return
-
         # Try to execute callback
         try:
             if self._expect_args:
@@ -501,9 +520,14 @@ class EventSystem(object):
     """
 
     default_order = 100
+    # Maximum number of topics with cached callbacks
+    callbacks_cache_limit = 100
 
     def __init__(self):
         self._registered_callbacks = []
+        self._registered_callbacks_set = set()
+        # Sorted callbacks matching topic, cached by topic
+        self._callbacks_by_topic = {}
 
     def add_callback(self, topic, callback, order=None):
         """Register callback in event system.
@@ -524,7 +548,10 @@ class EventSystem(object):
             order = self.default_order
 
         callback = EventCallback(topic, callback, order)
+        callback._set_event_system(self)
         self._registered_callbacks.append(callback)
+        self._registered_callbacks_set.add(callback)
+        self._invalidate_callbacks_cache()
         return callback
 
     def create_event(self, topic, data, source):
@@ -575,13 +602,64 @@ class EventSystem(object):
             event (Event): Prepared event with topic and data.
         """
 
-        callbacks = tuple(sorted(
-            self._registered_callbacks, key=lambda x: x.order
-        ))
+        callbacks = self._get_topic_callbacks(event.topic)
         for callback in callbacks:
-            callback.process_event(event)
-            if not callback.is_ref_valid:
+            callback._process_matched_event(event)
+            # Callback may be already removed from registered callbacks
+            #   if other callback caused refresh of cache during processing
+            if (
+                not callback.is_ref_valid
+                and callback in self._registered_callbacks_set
+            ):
                 self._registered_callbacks.remove(callback)
+                self._registered_callbacks_set.discard(callback)
+                self._invalidate_callbacks_cache()
+
+    def _invalidate_callbacks_cache(self):
+        self._callbacks_by_topic = {}
+
+    def _get_topic_callbacks(self, topic):
+        """Get sorted callbacks which are listening to a topic.
+
+        Args:
+            topic (str): Event topic.
+
+        Returns:
+            tuple[EventCallback, ...]: Callbacks sorted by their order.
+        """
+
+        callbacks = self._callbacks_by_topic.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        # Remove callbacks with invalid reference, they would not be removed
+        #   on event processing if their topic is not emitted
+        if any(
+            not callback.is_ref_valid
+            for callback in self._registered_callbacks
+        ):
+            self._registered_callbacks = [
+                callback
+                for callback in self._registered_callbacks
+                if callback.is_ref_valid
+            ]
+            self._registered_callbacks_set = set(self._registered_callbacks)
+            self._callbacks_by_topic = {}
+
+        # Topics may be dynamic, don't let the cache grow infinitely
+        if len(self._callbacks_by_topic) >= self.callbacks_cache_limit:
+            self._callbacks_by_topic = {}
+
+        callbacks = tuple(sorted(
+            (
+                callback
+                for callback in self._registered_callbacks
+                if callback.topic_matches(topic)
+            ),
+            key=lambda x: x.order
+        ))
+        self._callbacks_by_topic[topic] = callbacks
+        return callbacks
 
 
 class QueuedEventSystem(EventSystem):
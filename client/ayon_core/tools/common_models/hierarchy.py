@@ -408,6 +408,46 @@ class HierarchyModel(object):
             self._refresh_tasks_cache(project_name, folder_id, sender)
         return task_cache.get_data()
 
+    def get_task_items_by_folder_ids(self, project_name, folder_ids, sender):
+        """Get task items for multiple folders.
+
+        Tasks of folders which are not cached are queried at once and
+        stored to cache. Refresh events are emitted for each of the folders
+        the same way as in 'get_task_items'. Folders which are already being
+        refreshed are not queried again.
+
+        Args:
+            project_name (str): Project name.
+            folder_ids (Iterable[str]): Folder ids.
+            sender (Union[str, None]): Who requested the task items.
+
+        Returns:
+            dict[str, list[TaskItem]]: Task items by folder id.
+        """
+
+        folder_ids = set(folder_ids)
+        if not project_name or not folder_ids:
+            return {folder_id: [] for folder_id in folder_ids}
+
+        project_cache = self._task_items[project_name]
+        missing_folder_ids = {
+            folder_id
+            for folder_id in folder_ids
+            if (
+                not project_cache[folder_id].is_valid
+                and folder_id not in self._tasks_refreshing
+            )
+        }
+        if missing_folder_ids:
+            self._refresh_multiple_tasks_cache(
+                project_name, missing_folder_ids, sender
+            )
+
+        return {
+            folder_id: project_cache[folder_id].get_data()
+            for folder_id in folder_ids
+        }
+
     def get_folder_entities(self, project_name, folder_ids):
         """Get folder entities by ids.
 
@@ -565,6 +605,33 @@ class HierarchyModel(object):
             task_items = self._query_tasks(project_name, folder_id)
             self._task_items[project_name][folder_id] = task_items
 
+    def _refresh_multiple_tasks_cache(
+        self, project_name, folder_ids, sender=None
+    ):
+        with contextlib.ExitStack() as stack:
+            for folder_id in folder_ids:
+                stack.enter_context(self._task_refresh_event_manager(
+                    project_name, folder_id, sender
+                ))
+
+            task_items_by_folder_id = {
+                folder_id: []
+                for folder_id in folder_ids
+            }
+            tasks = ayon_api.get_tasks(
+                project_name,
+                folder_ids=folder_ids,
+                fields={"id", "name", "label", "folderId", "type"}
+            )
+            for task_item in _get_task_items_from_tasks(tasks):
+                task_items_by_folder_id[task_item.parent_id].append(
+                    task_item
+                )
+
+            project_cache = self._task_items[project_name]
+            for folder_id, task_items in task_items_by_folder_id.items():
+                project_cache[folder_id] = task_items
+
     def _query_tasks(self, project_name, folder_id):
         tasks = list(ayon_api.get_tasks(
             project_name,
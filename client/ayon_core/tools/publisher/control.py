@@ -2,14 +2,14 @@ import os
 import copy
 import logging
 import traceback
-import collections
 import uuid
+import itertools
+import collections
+import operator
 import tempfile
 import shutil
-import inspect
-from abc import ABCMeta, abstractmethod
+from abc import ABC, abstractmethod
 
-import six
 import arrow
 import pyblish.api
 import ayon_api
@@ -43,6 +43,9 @@ from ayon_core.tools.common_models import HierarchyModel
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
 
+# Counter used to create ids of grouped validation errors
+_error_group_id_counter = itertools.count()
+
 
 class CardMessageTypes:
     standard = None
@@ -53,6 +56,8 @@ class CardMessageTypes:
 class MainThreadItem:
     """Callback with args and kwargs."""
 
+    __slots__ = ("callback", "args", "kwargs")
+
     def __init__(self, callback, *args, **kwargs):
         self.callback = callback
         self.args = args
@@ -75,11 +80,19 @@ class PublishReportMaker:
         self._publish_discover_result = None
 
         self._plugin_data_by_id = {}
+        self._plugin_static_data_by_id = {}
+        self._formatted_tracebacks = {}
         self._current_plugin = None
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = None
 
+        # Data of last created report, plugins and context instance ids
+        #   used to create it
+        self._cached_report_data = None
+        self._cached_report_plugins = None
+        self._cached_report_instance_ids = None
+
     def reset(self, context, create_context):
         """Reset report and clear all data."""
 
@@ -90,17 +103,26 @@ class PublishReportMaker:
         self._publish_discover_result = create_context.publish_discover_result
 
         self._plugin_data_by_id = {}
+        self._plugin_static_data_by_id = {}
+        self._formatted_tracebacks = {}
         self._current_plugin = None
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = context
+        self._invalidate_cache()
 
         for plugin in create_context.publish_plugins_mismatch_targets:
             plugin_data = self._add_plugin_data_item(plugin)
             plugin_data["skipped"] = True
 
+    def _invalidate_cache(self):
+        self._cached_report_data = None
+        self._cached_report_plugins = None
+        self._cached_report_instance_ids = None
+
     def add_plugin_iter(self, plugin, context):
         """Add report about single iteration of plugin."""
+        self._invalidate_cache()
         for instance in context:
             self._all_instances_by_id[instance.id] = instance
 
@@ -111,7 +133,11 @@ class PublishReportMaker:
         self._current_plugin_data = self._add_plugin_data_item(plugin)
 
     def _add_plugin_data_item(self, plugin):
-        if plugin.id in self._plugin_data_by_id:
+        plugin_data_item = self._create_plugin_data_item(plugin)
+        stored_item = self._plugin_data_by_id.setdefault(
+            plugin.id, plugin_data_item
+        )
+        if stored_item is not plugin_data_item:
             # A plugin would be processed more than once. What can cause it:
             #   - there is a bug in controller
             #   - plugin class is imported into multiple files
@@ -119,35 +145,79 @@ class PublishReportMaker:
             raise ValueError(
                 "Plugin '{}' is already stored".format(str(plugin)))
 
-        plugin_data_item = self._create_plugin_data_item(plugin)
-        self._plugin_data_by_id[plugin.id] = plugin_data_item
-
         return plugin_data_item
 
+    def _get_plugin_static_data(self, plugin):
+        """Data of plugin that don't change during publishing.
+
+        Data are cached until reset, plugins are not changed in meantime.
+
+        Args:
+            plugin (pyblish.api.Plugin): Publish plugin.
+
+        Returns:
+            tuple[str, Union[str, None], float, tuple[str, ...]]: Plugin name,
+                label, order and targets.
+        """
+
+        static_data = self._plugin_static_data_by_id.get(plugin.id)
+        if static_data is None:
+            label = None
+            if hasattr(plugin, "label"):
+                label = plugin.label
+            static_data = (
+                plugin.__name__,
+                label,
+                plugin.order,
+                tuple(plugin.targets),
+            )
+            self._plugin_static_data_by_id[plugin.id] = static_data
+        return static_data
+
     def _create_plugin_data_item(self, plugin):
-        label = None
-        if hasattr(plugin, "label"):
-            label = plugin.label
+        """Create data item which is filled during publishing.
+
+        Static data of plugin are not part of the item, they're added only
+        to output of 'get_report'.
+        """
 
+        # Make sure static data are cached
+        self._get_plugin_static_data(plugin)
         return {
-            "id": plugin.id,
-            "name": plugin.__name__,
-            "label": label,
-            "order": plugin.order,
-            "targets": list(plugin.targets),
             "instances_data": [],
             "actions_data": [],
             "skipped": False,
             "passed": False
         }
 
+    def _create_plugin_report_data(self, plugin_id, plugin_data):
+        name, label, order, targets = (
+            self._plugin_static_data_by_id[plugin_id]
+        )
+        output = {
+            "id": plugin_id,
+            "name": name,
+            "label": label,
+            "order": order,
+            "targets": list(targets),
+            # Lists are copied because results are appended to them, items
+            #   and their logs are not modified after they're stored
+            "instances_data": list(plugin_data["instances_data"]),
+            "actions_data": list(plugin_data["actions_data"]),
+            "skipped": plugin_data["skipped"],
+            "passed": plugin_data["passed"],
+        }
+        return output
+
     def set_plugin_skipped(self):
         """Set that current plugin has been skipped."""
+        self._invalidate_cache()
         self._current_plugin_data["skipped"] = True
 
     def add_result(self, result):
         """Handle result of one plugin and it's instance."""
 
+        self._invalidate_cache()
         instance = result["instance"]
         instance_id = None
         if instance is not None:
@@ -160,6 +230,7 @@ class PublishReportMaker:
 
     def add_action_result(self, action, result):
         """Add result of single action."""
+        self._invalidate_cache()
         plugin = result["plugin"]
 
         store_item = self._plugin_data_by_id.get(plugin.id)
@@ -177,33 +248,72 @@ class PublishReportMaker:
         })
 
     def get_report(self, publish_plugins=None):
-        """Report data with all details of current state."""
+        """Report data with all details of current state.
+
+        Content of report is cached until state of report maker or
+        instances in publish context change, only id and creation time are
+        new for each report. Nested data are shared between reports and
+        must not be modified.
+        """
+
+        # Instances can be added to or removed from context outside of
+        #   report maker
+        context_instance_ids = ()
+        if self._current_context is not None:
+            context_instance_ids = tuple(
+                instance.id
+                for instance in self._current_context
+            )
+
+        report_data = self._cached_report_data
+        if (
+            report_data is None
+            or self._cached_report_plugins is not publish_plugins
+            or self._cached_report_instance_ids != context_instance_ids
+        ):
+            report_data = self._create_report_data(
+                publish_plugins, set(context_instance_ids)
+            )
+            self._cached_report_data = report_data
+            self._cached_report_plugins = publish_plugins
+            self._cached_report_instance_ids = context_instance_ids
 
         now = arrow.utcnow().to("local")
+        output = dict(report_data)
+        output["id"] = uuid.uuid4().hex
+        output["created_at"] = now.isoformat()
+        output["report_version"] = "1.0.1"
+        return output
+
+    def _create_report_data(self, publish_plugins, context_instance_ids):
         instances_details = {}
-        for instance in self._all_instances_by_id.values():
-            instances_details[instance.id] = self._extract_instance_data(
-                instance, instance in self._current_context
+        for instance_id, instance in self._all_instances_by_id.items():
+            instances_details[instance_id] = self._extract_instance_data(
+                instance, instance_id in context_instance_ids
             )
 
-        plugins_data_by_id = copy.deepcopy(
-            self._plugin_data_by_id
-        )
-
-        # Ensure the current plug-in is marked as `passed` in the result
-        # so that it shows on reports for paused publishes
+        current_plugin_id = None
         if self._current_plugin is not None:
-            current_plugin_data = plugins_data_by_id.get(
-                self._current_plugin.id
+            current_plugin_id = self._current_plugin.id
+
+        plugins_data = []
+        for plugin_id, plugin_data in self._plugin_data_by_id.items():
+            plugin_report_data = self._create_plugin_report_data(
+                plugin_id, plugin_data
             )
-            if current_plugin_data and not current_plugin_data["passed"]:
-                current_plugin_data["passed"] = True
+            # Ensure the current plug-in is marked as `passed` in the result
+            # so that it shows on reports for paused publishes
+            if plugin_id == current_plugin_id:
+                plugin_report_data["passed"] = True
+            plugins_data.append(plugin_report_data)
 
         if publish_plugins:
             for plugin in publish_plugins:
-                if plugin.id not in plugins_data_by_id:
-                    plugins_data_by_id[plugin.id] = \
-                        self._create_plugin_data_item(plugin)
+                plugin_id = plugin.id
+                if plugin_id not in self._plugin_data_by_id:
+                    plugins_data.append(self._create_plugin_report_data(
+                        plugin_id, self._create_plugin_data_item(plugin)
+                    ))
 
         reports = []
         if self._create_discover_result is not None:
@@ -219,18 +329,15 @@ class PublishReportMaker:
         for report in reports:
             items = report.crashed_file_paths.items()
             for filepath, exc_info in items:
-                crashed_file_paths[filepath] = "".join(
-                    traceback.format_exception(*exc_info)
+                crashed_file_paths[filepath] = (
+                    self._format_crashed_file_exc_info(exc_info)
                 )
 
         return {
-            "plugins_data": list(plugins_data_by_id.values()),
+            "plugins_data": plugins_data,
             "instances": instances_details,
             "context": self._extract_context_data(self._current_context),
             "crashed_file_paths": crashed_file_paths,
-            "id": uuid.uuid4().hex,
-            "created_at": now.isoformat(),
-            "report_version": "1.0.1",
         }
 
     def _extract_context_data(self, context):
@@ -242,15 +349,16 @@ class PublishReportMaker:
         }
 
     def _extract_instance_data(self, instance, exists):
+        get_value = instance.data.get
         return {
-            "name": instance.data.get("name"),
+            "name": get_value("name"),
             "label": get_publish_instance_label(instance),
-            "product_type": instance.data.get("productType"),
-            "family": instance.data.get("family"),
-            "families": instance.data.get("families") or [],
+            "product_type": get_value("productType"),
+            "family": get_value("family"),
+            "families": get_value("families") or [],
             "exists": exists,
-            "creator_identifier": instance.data.get("creator_identifier"),
-            "instance_id": instance.data.get("instance_id"),
+            "creator_identifier": get_value("creator_identifier"),
+            "instance_id": get_value("instance_id"),
         }
 
     def _extract_instance_log_items(self, result):
@@ -264,6 +372,31 @@ class PublishReportMaker:
             item["instance_id"] = instance_id
         return log_items
 
+    def _format_crashed_file_exc_info(self, exc_info):
+        """Format exception info of crashed file to string.
+
+        Formatted tracebacks are cached by exception until reset, so they're
+        not formatted for each report. Exception info is already stored in
+        discover results so the cache does not keep anything else alive.
+
+        Args:
+            exc_info (tuple): Exception info as returned by 'sys.exc_info'.
+
+        Returns:
+            str: Formatted traceback.
+        """
+
+        # Keep reference to exception info in cache so id of the exception
+        #   can't be reused by other object
+        key = id(exc_info[1])
+        cached = self._formatted_tracebacks.get(key)
+        if cached is not None and cached[0][1] is exc_info[1]:
+            return cached[1]
+
+        formatted = "".join(traceback.format_exception(*exc_info))
+        self._formatted_tracebacks[key] = (exc_info, formatted)
+        return formatted
+
     def _extract_log_items(self, result):
         output = []
         records = result.get("records") or []
@@ -274,10 +407,14 @@ class PublishReportMaker:
                     traceback.format_exception(*record_exc_info)
                 )
 
-            try:
-                msg = record.getMessage()
-            except Exception:
+            # Message without arguments does not need formatting
+            if not record.args:
                 msg = str(record.msg)
+            else:
+                try:
+                    msg = record.getMessage()
+                except Exception:
+                    msg = str(record.msg)
 
             output.append({
                 "type": "record",
@@ -429,6 +566,17 @@ class PublishPluginActionItem:
         icon (Union[str, None]) Action's icon.
     """
 
+    __slots__ = (
+        "action_id",
+        "plugin_id",
+        "active",
+        "on_filter",
+        "label",
+        "icon",
+    )
+    # Getter of all attributes used for serialization
+    _attrs_getter = operator.attrgetter(*__slots__)
+
     def __init__(self, action_id, plugin_id, active, on_filter, label, icon):
         self.action_id = action_id
         self.plugin_id = plugin_id
@@ -444,14 +592,7 @@ class PublishPluginActionItem:
             Dict[str, Union[str,bool,None]]: Serialized object.
         """
 
-        return {
-            "action_id": self.action_id,
-            "plugin_id": self.plugin_id,
-            "active": self.active,
-            "on_filter": self.on_filter,
-            "label": self.label,
-            "icon": self.icon
-        }
+        return dict(zip(self.__slots__, self._attrs_getter(self)))
 
     @classmethod
     def from_data(cls, data):
@@ -485,6 +626,18 @@ class ValidationErrorItem:
             error. Id is generated using 'PublishPluginsProxy'.
     """
 
+    __slots__ = (
+        "instance_id",
+        "instance_label",
+        "plugin_id",
+        "context_validation",
+        "title",
+        "description",
+        "detail",
+    )
+    # Getter of all attributes used for serialization
+    _attrs_getter = operator.attrgetter(*__slots__)
+
     def __init__(
         self,
         instance_id,
@@ -510,15 +663,7 @@ class ValidationErrorItem:
             Dict[str, Union[str, bool, None]]: Serialized object data.
         """
 
-        return {
-            "instance_id": self.instance_id,
-            "instance_label": self.instance_label,
-            "plugin_id": self.plugin_id,
-            "context_validation": self.context_validation,
-            "title": self.title,
-            "description": self.description,
-            "detail": self.detail,
-        }
+        return dict(zip(self.__slots__, self._attrs_getter(self)))
 
     @classmethod
     def from_result(cls, plugin_id, error, instance):
@@ -561,8 +706,24 @@ class PublishValidationErrorsReport:
     """
 
     def __init__(self, error_items, plugin_action_items):
+        # Group error items by plugin id and by title
+        # - dictionaries keep order of insertion
+        error_items_by_title_by_plugin_id = {}
+        for error_item in error_items:
+            error_items_by_title = (
+                error_items_by_title_by_plugin_id.setdefault(
+                    error_item.plugin_id, {}
+                )
+            )
+            error_items_by_title.setdefault(
+                error_item.title, []
+            ).append(error_item)
+
         self._error_items = error_items
         self._plugin_action_items = plugin_action_items
+        self._error_items_by_title_by_plugin_id = (
+            error_items_by_title_by_plugin_id
+        )
 
     def __iter__(self):
         for item in self._error_items:
@@ -579,33 +740,19 @@ class PublishValidationErrorsReport:
                 information related to title and possible plugin actions.
         """
 
-        ordered_plugin_ids = []
-        error_items_by_plugin_id = collections.defaultdict(list)
-        for error_item in self._error_items:
-            plugin_id = error_item.plugin_id
-            if plugin_id not in ordered_plugin_ids:
-                ordered_plugin_ids.append(plugin_id)
-            error_items_by_plugin_id[plugin_id].append(error_item)
-
         grouped_error_items = []
-        for plugin_id in ordered_plugin_ids:
+        for plugin_id, error_items_by_title in (
+            self._error_items_by_title_by_plugin_id.items()
+        ):
             plugin_action_items = self._plugin_action_items[plugin_id]
-            error_items = error_items_by_plugin_id[plugin_id]
-
-            titles = []
-            error_items_by_title = collections.defaultdict(list)
-            for error_item in error_items:
-                title = error_item.title
-                if title not in titles:
-                    titles.append(error_item.title)
-                error_items_by_title[title].append(error_item)
-
-            for title in titles:
+            for title, title_error_items in error_items_by_title.items():
                 grouped_error_items.append({
-                    "id": uuid.uuid4().hex,
+                    "id": "error-group-{}".format(
+                        next(_error_group_id_counter)
+                    ),
                     "plugin_id": plugin_id,
                     "plugin_action_items": list(plugin_action_items),
-                    "error_items": error_items_by_title[title],
+                    "error_items": title_error_items,
                     "title": title
                 })
         return grouped_error_items
@@ -696,7 +843,7 @@ class PublishValidationErrors:
         """
 
         return PublishValidationErrorsReport(
-            self._error_items, self._plugin_action_items
+            list(self._error_items), dict(self._plugin_action_items)
         )
 
     def add_error(self, plugin, error, instance):
@@ -712,11 +859,7 @@ class PublishValidationErrors:
         # Make sure the cached report is cleared
         plugin_id = self._plugins_proxy.get_plugin_id(plugin)
         if not error.title:
-            if hasattr(plugin, "label") and plugin.label:
-                plugin_label = plugin.label
-            else:
-                plugin_label = plugin.__name__
-            error.title = plugin_label
+            error.title = get_plugin_label(plugin)
 
         self._error_items.append(
             ValidationErrorItem.from_result(plugin_id, error, instance)
@@ -738,8 +881,15 @@ class CreatorType:
         return self.name
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, CreatorType):
+            return self.name == other.name
         return self.name == str(other)
 
+    def __hash__(self):
+        return hash(self.name)
+
     def __ne__(self, other):
         # This is implemented only because of Python 2
         return not self == other
@@ -751,17 +901,21 @@ class CreatorTypes:
     hidden = CreatorType("hidden")
     artist = CreatorType("artist")
 
+    _by_name = {
+        creator_type.name: creator_type
+        for creator_type in (base, auto, hidden, artist)
+    }
+
     @classmethod
     def from_str(cls, value):
-        for creator_type in (
-            cls.base,
-            cls.auto,
-            cls.hidden,
-            cls.artist
-        ):
-            if value == creator_type:
-                return creator_type
-        raise ValueError("Unknown type \"{}\"".format(str(value)))
+        # Strings and 'CreatorType' objects are found without conversion
+        creator_type = cls._by_name.get(value)
+        if creator_type is None:
+            value = str(value)
+            creator_type = cls._by_name.get(value)
+            if creator_type is None:
+                raise ValueError("Unknown type \"{}\"".format(value))
+        return creator_type
 
 
 class CreatorItem:
@@ -770,6 +924,26 @@ class CreatorItem:
     Object can be serialized and recreated.
     """
 
+    # Keys of serialized data matching attribute names
+    _data_keys = (
+        "identifier",
+        "creator_type",
+        "product_type",
+        "label",
+        "group_label",
+        "icon",
+        "description",
+        "detailed_description",
+        "default_variant",
+        "default_variants",
+        "create_allow_context_change",
+        "create_allow_thumbnail",
+        "show_order",
+        "pre_create_attributes_defs",
+    )
+    __slots__ = _data_keys + ("_cached_data",)
+    _data_getter = operator.attrgetter(*_data_keys)
+
     def __init__(
         self,
         identifier,
@@ -802,6 +976,9 @@ class CreatorItem:
         self.show_order = show_order
         self.pre_create_attributes_defs = pre_create_attributes_defs
 
+        # Serialized data, item is not changed after creation
+        self._cached_data = None
+
     def get_group_label(self):
         return self.group_label
 
@@ -853,43 +1030,48 @@ class CreatorItem:
         )
 
     def to_data(self):
-        pre_create_attributes_defs = None
+        """Serialize object to dictionary.
+
+        Serialized data are cached and shared between calls, they must not
+        be modified. Use 'from_data' to recreate the object, it does not
+        modify passed data.
+
+        Returns:
+            Dict[str, Any]: Serialized object.
+        """
+
+        if self._cached_data is None:
+            self._cached_data = self._create_data()
+        return self._cached_data
+
+    def _create_data(self):
+        output = dict(zip(self._data_keys, self._data_getter(self)))
+        output["creator_type"] = str(self.creator_type)
         if self.pre_create_attributes_defs is not None:
-            pre_create_attributes_defs = serialize_attr_defs(
+            output["pre_create_attributes_defs"] = serialize_attr_defs(
                 self.pre_create_attributes_defs
             )
-
-        return {
-            "identifier": self.identifier,
-            "creator_type": str(self.creator_type),
-            "product_type": self.product_type,
-            "label": self.label,
-            "group_label": self.group_label,
-            "icon": self.icon,
-            "description": self.description,
-            "detailed_description": self.detailed_description,
-            "default_variant": self.default_variant,
-            "default_variants": self.default_variants,
-            "create_allow_context_change": self.create_allow_context_change,
-            "create_allow_thumbnail": self.create_allow_thumbnail,
-            "show_order": self.show_order,
-            "pre_create_attributes_defs": pre_create_attributes_defs,
-        }
+        return output
 
     @classmethod
     def from_data(cls, data):
+        # Deserialization of attribute definitions modifies the data
+        data = dict(data)
         pre_create_attributes_defs = data["pre_create_attributes_defs"]
         if pre_create_attributes_defs is not None:
             data["pre_create_attributes_defs"] = deserialize_attr_defs(
-                pre_create_attributes_defs
+                copy.deepcopy(pre_create_attributes_defs)
             )
 
+        default_variants = data["default_variants"]
+        if default_variants is not None:
+            data["default_variants"] = list(default_variants)
+
         data["creator_type"] = CreatorTypes.from_str(data["creator_type"])
         return cls(**data)
 
 
-@six.add_metaclass(ABCMeta)
-class AbstractPublisherController(object):
+class AbstractPublisherController(ABC):
     """Publisher tool controller.
 
     Define what must be implemented to be able use Publisher functionality.
@@ -1296,6 +1478,37 @@ class AbstractPublisherController(object):
         pass
 
 
+class _ControllerAttribute:
+    """Controller attribute which emits an event when value changes.
+
+    Value is stored on controller under attribute name with underscore
+    prefix. Event data contain new value under key "value".
+
+    Args:
+        topic (Optional[str]): Topic of event emitted on value change. Event
+            is not emitted if is not set.
+    """
+
+    def __init__(self, topic=None):
+        self._topic = topic
+        self._attr_name = None
+
+    def __set_name__(self, owner, name):
+        self._attr_name = "_" + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return getattr(instance, self._attr_name)
+
+    def __set__(self, instance, value):
+        if getattr(instance, self._attr_name) == value:
+            return
+        setattr(instance, self._attr_name, value)
+        if self._topic is not None:
+            instance._emit_event(self._topic, {"value": value})
+
+
 class BasePublisherController(AbstractPublisherController):
     """Implement common logic for controllers.
 
@@ -1308,8 +1521,15 @@ class BasePublisherController(AbstractPublisherController):
     All prepared implementation is based on calling super '__init__'.
     """
 
+    _log = logging.getLogger("BasePublisherController")
+    # Path is same for whole process
+    _thumbnail_temp_dir_path = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._log = logging.getLogger(cls.__name__)
+
     def __init__(self):
-        self._log = None
         self._event_system = None
 
         # Host is valid for creation
@@ -1341,8 +1561,6 @@ class BasePublisherController(AbstractPublisherController):
             logging.Logger: Logger object that can be used for logging.
         """
 
-        if self._log is None:
-            self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
     @property
@@ -1399,122 +1617,22 @@ class BasePublisherController(AbstractPublisherController):
     def _emit_event(self, topic, data=None):
         self.emit_event(topic, data, "controller")
 
-    def _get_host_is_valid(self):
-        return self._host_is_valid
-
-    def _set_host_is_valid(self, value):
-        if self._host_is_valid != value:
-            self._host_is_valid = value
-            self._emit_event(
-                "publish.host_is_valid.changed", {"value": value}
-            )
-
-    def _get_publish_has_started(self):
-        return self._publish_has_started
-
-    def _set_publish_has_started(self, value):
-        if value != self._publish_has_started:
-            self._publish_has_started = value
-
-    def _get_publish_has_finished(self):
-        return self._publish_has_finished
-
-    def _set_publish_has_finished(self, value):
-        if self._publish_has_finished != value:
-            self._publish_has_finished = value
-            self._emit_event("publish.finished.changed", {"value": value})
-
-    def _get_publish_is_running(self):
-        return self._publish_is_running
-
-    def _set_publish_is_running(self, value):
-        if self._publish_is_running != value:
-            self._publish_is_running = value
-            self._emit_event("publish.is_running.changed", {"value": value})
-
-    def _get_publish_has_validated(self):
-        return self._publish_has_validated
-
-    def _set_publish_has_validated(self, value):
-        if self._publish_has_validated != value:
-            self._publish_has_validated = value
-            self._emit_event(
-                "publish.has_validated.changed", {"value": value}
-            )
-
-    def _get_publish_has_crashed(self):
-        return self._publish_has_crashed
-
-    def _set_publish_has_crashed(self, value):
-        if self._publish_has_crashed != value:
-            self._publish_has_crashed = value
-            self._emit_event("publish.has_crashed.changed", {"value": value})
-
-    def _get_publish_has_validation_errors(self):
-        return self._publish_has_validation_errors
-
-    def _set_publish_has_validation_errors(self, value):
-        if self._publish_has_validation_errors != value:
-            self._publish_has_validation_errors = value
-            self._emit_event(
-                "publish.has_validation_errors.changed",
-                {"value": value}
-            )
-
-    def _get_publish_max_progress(self):
-        return self._publish_max_progress
-
-    def _set_publish_max_progress(self, value):
-        if self._publish_max_progress != value:
-            self._publish_max_progress = value
-            self._emit_event("publish.max_progress.changed", {"value": value})
-
-    def _get_publish_progress(self):
-        return self._publish_progress
-
-    def _set_publish_progress(self, value):
-        if self._publish_progress != value:
-            self._publish_progress = value
-            self._emit_event("publish.progress.changed", {"value": value})
-
-    def _get_publish_error_msg(self):
-        return self._publish_error_msg
-
-    def _set_publish_error_msg(self, value):
-        if self._publish_error_msg != value:
-            self._publish_error_msg = value
-            self._emit_event("publish.publish_error.changed", {"value": value})
-
-    host_is_valid = property(
-        _get_host_is_valid, _set_host_is_valid
-    )
-    publish_has_started = property(
-        _get_publish_has_started, _set_publish_has_started
-    )
-    publish_has_finished = property(
-        _get_publish_has_finished, _set_publish_has_finished
-    )
-    publish_is_running = property(
-        _get_publish_is_running, _set_publish_is_running
+    host_is_valid = _ControllerAttribute("publish.host_is_valid.changed")
+    publish_has_started = _ControllerAttribute()
+    publish_has_finished = _ControllerAttribute("publish.finished.changed")
+    publish_is_running = _ControllerAttribute("publish.is_running.changed")
+    publish_has_validated = _ControllerAttribute(
+        "publish.has_validated.changed"
     )
-    publish_has_validated = property(
-        _get_publish_has_validated, _set_publish_has_validated
+    publish_has_crashed = _ControllerAttribute("publish.has_crashed.changed")
+    publish_has_validation_errors = _ControllerAttribute(
+        "publish.has_validation_errors.changed"
     )
-    publish_has_crashed = property(
-        _get_publish_has_crashed, _set_publish_has_crashed
-    )
-    publish_has_validation_errors = property(
-        _get_publish_has_validation_errors, _set_publish_has_validation_errors
-    )
-    publish_max_progress = property(
-        _get_publish_max_progress, _set_publish_max_progress
-    )
-    publish_progress = property(
-        _get_publish_progress, _set_publish_progress
-    )
-    publish_error_msg = property(
-        _get_publish_error_msg, _set_publish_error_msg
+    publish_max_progress = _ControllerAttribute(
+        "publish.max_progress.changed"
     )
+    publish_progress = _ControllerAttribute("publish.progress.changed")
+    publish_error_msg = _ControllerAttribute("publish.publish_error.changed")
 
     def _reset_attributes(self):
         """Reset most of attributes that can be reset."""
@@ -1565,18 +1683,33 @@ class BasePublisherController(AbstractPublisherController):
             str: Path to a directory.
         """
 
-        return os.path.join(
-            tempfile.gettempdir(),
-            "publisher_thumbnails",
-            get_process_id()
-        )
+        cls = BasePublisherController
+        if cls._thumbnail_temp_dir_path is None:
+            cls._thumbnail_temp_dir_path = os.path.join(
+                tempfile.gettempdir(),
+                "publisher_thumbnails",
+                get_process_id()
+            )
+        return cls._thumbnail_temp_dir_path
 
     def clear_thumbnail_temp_dir_path(self):
         """Remove content of thumbnail temp directory."""
 
         dirpath = self.get_thumbnail_temp_dir_path()
-        if os.path.exists(dirpath):
-            shutil.rmtree(dirpath)
+        try:
+            entries = os.scandir(dirpath)
+        except FileNotFoundError:
+            return
+
+        # Thumbnails are stored as files directly in the directory
+        #   so 'rmtree' is used only for unexpected subdirectories
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(dirpath)
 
 
 class PublisherController(BasePublisherController):
@@ -1588,8 +1721,6 @@ class PublisherController(BasePublisherController):
         headless (bool): Headless publishing. ATM not implemented or used.
     """
 
-    _log = None
-
     def __init__(self, headless=False):
         super(PublisherController, self).__init__()
 
@@ -1621,9 +1752,23 @@ class PublisherController(BasePublisherController):
         self._validation_order = (
             pyblish.api.ValidatorOrder + PLUGIN_ORDER_OFFSET
         )
+        # Index of first publish plugin with validation order or higher
+        self._validation_plugin_index = 0
+        # Names of plugins with attribute definitions in plugins order
+        self._plugin_names_with_defs = ()
+        # Families of active instances in publish context
+        # - must be reset when any plugin or action is processed
+        self._publish_families = None
+        # Last instance label sent with 'publish.process.instance.changed'
+        self._last_instance_label = None
 
         # Plugin iterator
         self._main_thread_iter = None
+        # Item stopping publishing, it does not hold any state so can be reused
+        self._stop_publish_item = MainThreadItem(self.stop_publish)
+        # Items waiting for processing when items are processed directly
+        self._main_thread_items = collections.deque()
+        self._processing_main_thread_items = False
 
         # State flags to prevent executing method which is already in progress
         self._resetting_plugins = False
@@ -1632,6 +1777,11 @@ class PublisherController(BasePublisherController):
         # Cacher of avalon documents
         self._hierarchy_model = HierarchyModel(self)
 
+        # Context title is resolved on reset
+        self._context_title = None
+        # Existing product names by project name and folder path
+        self._existing_product_names_cache = {}
+
     @property
     def project_name(self):
         """Current project context defined by host.
@@ -1724,12 +1874,18 @@ class PublisherController(BasePublisherController):
             folder_path: set()
             for folder_path in folder_paths
         }
-        project_name = self.project_name
-        for folder_item in folder_items.values():
-            task_items = self._hierarchy_model.get_task_items(
-                project_name, folder_item.entity_id, None
+        folder_paths_by_id = {
+            folder_item.entity_id: folder_item.path
+            for folder_item in folder_items.values()
+            if folder_item is not None
+        }
+        task_items_by_folder_id = (
+            self._hierarchy_model.get_task_items_by_folder_ids(
+                self.project_name, folder_paths_by_id.keys(), None
             )
-            output[folder_item.path] = {
+        )
+        for folder_id, task_items in task_items_by_folder_id.items():
+            output[folder_paths_by_id[folder_id]] = {
                 task_item.name
                 for task_item in task_items
             }
@@ -1739,22 +1895,29 @@ class PublisherController(BasePublisherController):
     def are_folder_paths_valid(self, folder_paths):
         if not folder_paths:
             return True
-        folder_paths = set(folder_paths)
         folder_items = self._hierarchy_model.get_folder_items_by_paths(
             self.project_name, folder_paths
         )
-        for folder_item in folder_items.values():
-            if folder_item is None:
-                return False
-        return True
+        return None not in folder_items.values()
 
     # --- Publish specific callbacks ---
     def get_context_title(self):
-        """Get context title for artist shown at the top of main window."""
+        """Get context title for artist shown at the top of main window.
+
+        Title is cached and resolved again on reset.
+        """
 
+        if self._context_title is None:
+            self._context_title = self._get_context_title()
+        return self._context_title
+
+    def _get_context_title(self):
         context_title = None
-        if hasattr(self._host, "get_context_title"):
-            context_title = self._host.get_context_title()
+        get_host_context_title = getattr(
+            self._host, "get_context_title", None
+        )
+        if get_host_context_title is not None:
+            context_title = get_host_context_title()
 
         if context_title is None:
             context_title = os.environ.get("AYON_APP_NAME")
@@ -1767,6 +1930,11 @@ class PublisherController(BasePublisherController):
         if not folder_path:
             return None
         project_name = self.project_name
+        cache_key = (project_name, folder_path)
+        product_names = self._existing_product_names_cache.get(cache_key)
+        if product_names is not None:
+            return set(product_names)
+
         folder_item = self._hierarchy_model.get_folder_item_by_path(
             project_name, folder_path
         )
@@ -1778,10 +1946,12 @@ class PublisherController(BasePublisherController):
             folder_ids={folder_item.entity_id},
             fields={"name"}
         )
-        return {
+        product_names = {
             product_entity["name"]
             for product_entity in product_entities
         }
+        self._existing_product_names_cache[cache_key] = product_names
+        return set(product_names)
 
     def reset(self):
         """Reset everything related to creation and publishing."""
@@ -1795,6 +1965,8 @@ class PublisherController(BasePublisherController):
 
         # Reset current context
         self._create_context.reset_current_context()
+        self._context_title = None
+        self._existing_product_names_cache = {}
 
         self._hierarchy_model.reset()
 
@@ -1887,20 +2059,18 @@ class PublisherController(BasePublisherController):
         self._on_create_instance_change()
 
     def get_thumbnail_paths_for_instances(self, instance_ids):
-        thumbnail_paths_by_instance_id = (
-            self._create_context.thumbnail_paths_by_instance_id
+        get_thumbnail_path = (
+            self._create_context.thumbnail_paths_by_instance_id.get
         )
         return {
-            instance_id: thumbnail_paths_by_instance_id.get(instance_id)
+            instance_id: get_thumbnail_path(instance_id)
             for instance_id in instance_ids
         }
 
     def set_thumbnail_paths_for_instances(self, thumbnail_path_mapping):
-        thumbnail_paths_by_instance_id = (
-            self._create_context.thumbnail_paths_by_instance_id
+        self._create_context.thumbnail_paths_by_instance_id.update(
+            thumbnail_path_mapping
         )
-        for instance_id, thumbnail_path in thumbnail_path_mapping.items():
-            thumbnail_paths_by_instance_id[instance_id] = thumbnail_path
 
         self._emit_event(
             "instance.thumbnail.changed",
@@ -1930,12 +2100,17 @@ class PublisherController(BasePublisherController):
 
         # NOTE it would be great if attrdefs would have hash method implemented
         #   so they could be used as keys in dictionary
+        # - equal attribute definitions must have same key so only
+        #   definitions with the same key are compared
         output = []
-        _attr_defs = {}
+        _attr_defs_by_key = {}
         for instance in instances:
             for attr_def in instance.creator_attribute_defs:
+                same_key_attr_defs = _attr_defs_by_key.setdefault(
+                    attr_def.key, []
+                )
                 found_idx = None
-                for idx, _attr_def in _attr_defs.items():
+                for idx, _attr_def in same_key_attr_defs:
                     if attr_def == _attr_def:
                         found_idx = idx
                         break
@@ -1946,7 +2121,7 @@ class PublisherController(BasePublisherController):
                 if found_idx is None:
                     idx = len(output)
                     output.append((attr_def, [instance], [value]))
-                    _attr_defs[idx] = attr_def
+                    same_key_attr_defs.append((idx, attr_def))
                 else:
                     item = output[found_idx]
                     item[1].append(instance)
@@ -1977,33 +2152,25 @@ class PublisherController(BasePublisherController):
                 if not attr_defs:
                     continue
 
-                if plugin_name not in all_defs_by_plugin_name:
-                    all_defs_by_plugin_name[plugin_name] = attr_val.attr_defs
-
-                if plugin_name not in all_plugin_values:
-                    all_plugin_values[plugin_name] = {}
-
-                plugin_values = all_plugin_values[plugin_name]
+                all_defs_by_plugin_name.setdefault(plugin_name, attr_defs)
+                plugin_values = all_plugin_values.setdefault(plugin_name, {})
 
                 for attr_def in attr_defs:
                     if isinstance(attr_def, UIDef):
                         continue
-                    if attr_def.key not in plugin_values:
-                        plugin_values[attr_def.key] = []
-                    attr_values = plugin_values[attr_def.key]
+                    attr_values = plugin_values.setdefault(attr_def.key, [])
 
                     value = attr_val[attr_def.key]
                     attr_values.append((item, value))
 
         output = []
-        for plugin in self._create_context.plugins_with_defs:
-            plugin_name = plugin.__name__
+        for plugin_name in self._plugin_names_with_defs:
             if plugin_name not in all_defs_by_plugin_name:
                 continue
             output.append((
                 plugin_name,
                 all_defs_by_plugin_name[plugin_name],
-                all_plugin_values
+                all_plugin_values[plugin_name]
             ))
         return output
 
@@ -2170,11 +2337,9 @@ class PublisherController(BasePublisherController):
         self._on_create_instance_change()
 
     def _remove_instances_from_context(self, instance_ids):
-        instances_by_id = self._create_context.instances_by_id
-        instances = [
-            instances_by_id[instance_id]
-            for instance_id in instance_ids
-        ]
+        instances = list(map(
+            self._create_context.instances_by_id.__getitem__, instance_ids
+        ))
         try:
             self._create_context.remove_instances(instances)
         except CreatorsOperationFailed as exc:
@@ -2203,6 +2368,8 @@ class PublisherController(BasePublisherController):
 
         self._main_thread_iter = self._publish_iterator()
         self._publish_context = pyblish.api.Context()
+        self._publish_families = None
+        self._last_instance_label = None
         # Make sure "comment" is set on publish context
         self._publish_context.data["comment"] = ""
         # Add access to create context during publishing
@@ -2214,6 +2381,11 @@ class PublisherController(BasePublisherController):
         self._publish_plugins_proxy = PublishPluginsProxy(
             self._publish_plugins
         )
+        self._validation_plugin_index = self._get_validation_plugin_index()
+        self._plugin_names_with_defs = tuple(
+            plugin.__name__
+            for plugin in self._create_context.plugins_with_defs
+        )
 
         self._publish_report.reset(self._publish_context, self._create_context)
         self._publish_validation_errors.reset(self._publish_plugins_proxy)
@@ -2222,6 +2394,19 @@ class PublisherController(BasePublisherController):
 
         self._emit_event("publish.reset.finished")
 
+    def _get_validation_plugin_index(self):
+        """Index of first plugin which is over validation order.
+
+        Returns:
+            int: Index of plugin. Amount of plugins is returned if there is
+                no plugin over validation order.
+        """
+
+        for idx, plugin in enumerate(self._publish_plugins):
+            if plugin.order >= self._validation_order:
+                return idx
+        return len(self._publish_plugins)
+
     def set_comment(self, comment):
         """Set comment from ui to pyblish context.
 
@@ -2271,6 +2456,8 @@ class PublisherController(BasePublisherController):
     def _stop_publish(self):
         """Stop or pause publishing."""
         self.publish_is_running = False
+        # Publishing may have created new products
+        self._existing_product_names_cache = {}
 
         self._emit_event("publish.process.stopped")
 
@@ -2285,6 +2472,7 @@ class PublisherController(BasePublisherController):
         plugin = self._publish_plugins_proxy.get_plugin(plugin_id)
         action = self._publish_plugins_proxy.get_action(plugin_id, action_id)
 
+        self._publish_families = None
         result = pyblish.plugin.process(
             plugin, self._publish_context, None, action.id
         )
@@ -2322,12 +2510,12 @@ class PublisherController(BasePublisherController):
             self.publish_has_validated
             and self.publish_has_validation_errors
         ):
-            item = MainThreadItem(self.stop_publish)
+            item = self._stop_publish_item
 
         # Any unexpected error happened
         # - everything should stop
         elif self.publish_has_crashed:
-            item = MainThreadItem(self.stop_publish)
+            item = self._stop_publish_item
 
         # Everything is ok so try to get new processing item
         else:
@@ -2336,7 +2524,19 @@ class PublisherController(BasePublisherController):
         self._process_main_thread_item(item)
 
     def _process_main_thread_item(self, item):
-        item()
+        # Processed item usually triggers processing of next item, the items
+        #   are queued and processed in a loop to avoid deep recursion
+        self._main_thread_items.append(item)
+        if self._processing_main_thread_items:
+            return
+
+        self._processing_main_thread_items = True
+        try:
+            while self._main_thread_items:
+                self._main_thread_items.popleft().process()
+        finally:
+            self._main_thread_items.clear()
+            self._processing_main_thread_items = False
 
     def _is_publish_plugin_active(self, plugin):
         """Decide if publish plugin is active.
@@ -2365,9 +2565,7 @@ class PublisherController(BasePublisherController):
         if not plugin.optional:
             return False
 
-        if OptionalPyblishPluginMixin in inspect.getmro(plugin):
-            return True
-        return False
+        return issubclass(plugin, OptionalPyblishPluginMixin)
 
     def _publish_iterator(self):
         """Main logic center of publishing.
@@ -2380,26 +2578,25 @@ class PublisherController(BasePublisherController):
         Also stops publishing, if should stop on validation.
         """
 
+        validation_plugin_index = self._validation_plugin_index
         for idx, plugin in enumerate(self._publish_plugins):
             self._publish_progress = idx
 
             # Check if plugin is over validation order
             if not self.publish_has_validated:
-                self.publish_has_validated = (
-                    plugin.order >= self._validation_order
-                )
+                self.publish_has_validated = idx >= validation_plugin_index
 
             # Stop if plugin is over validation order and process
             #   should process up to validation.
             if self._publish_up_validation and self.publish_has_validated:
-                yield MainThreadItem(self.stop_publish)
+                yield self._stop_publish_item
 
             # Stop if validation is over and validation errors happened
             if (
                 self.publish_has_validated
                 and self.publish_has_validation_errors
             ):
-                yield MainThreadItem(self.stop_publish)
+                yield self._stop_publish_item
 
             # Add plugin to publish report
             self._publish_report.add_plugin_iter(
@@ -2411,12 +2608,9 @@ class PublisherController(BasePublisherController):
                 continue
 
             # Trigger callback that new plugin is going to be processed
-            plugin_label = plugin.__name__
-            if hasattr(plugin, "label") and plugin.label:
-                plugin_label = plugin.label
             self._emit_event(
                 "publish.process.plugin.changed",
-                {"plugin_label": plugin_label}
+                {"plugin_label": get_plugin_label(plugin)}
             )
 
             # Plugin is instance plugin
@@ -2436,18 +2630,17 @@ class PublisherController(BasePublisherController):
                         instance.data.get("label")
                         or instance.data["name"]
                     )
-                    self._emit_event(
-                        "publish.process.instance.changed",
-                        {"instance_label": instance_label}
-                    )
+                    self._emit_instance_changed(instance_label)
 
                     yield MainThreadItem(
                         self._process_and_continue, plugin, instance
                     )
             else:
-                families = collect_families_from_instances(
-                    self._publish_context, only_active=True
-                )
+                if self._publish_families is None:
+                    self._publish_families = collect_families_from_instances(
+                        self._publish_context, only_active=True
+                    )
+                families = self._publish_families
                 plugins = pyblish.logic.plugins_by_families(
                     [plugin], families
                 )
@@ -2457,10 +2650,7 @@ class PublisherController(BasePublisherController):
                         or self._publish_context.data.get("name")
                         or "Context"
                     )
-                    self._emit_event(
-                        "publish.process.instance.changed",
-                        {"instance_label": instance_label}
-                    )
+                    self._emit_instance_changed(instance_label)
                     yield MainThreadItem(
                         self._process_and_continue, plugin, None
                     )
@@ -2470,7 +2660,18 @@ class PublisherController(BasePublisherController):
         # Cleanup of publishing process
         self.publish_has_finished = True
         self.publish_progress = self.publish_max_progress
-        yield MainThreadItem(self.stop_publish)
+        yield self._stop_publish_item
+
+    def _emit_instance_changed(self, instance_label):
+        """Emit change of processed instance if label has changed."""
+
+        if instance_label == self._last_instance_label:
+            return
+        self._last_instance_label = instance_label
+        self._emit_event(
+            "publish.process.instance.changed",
+            {"instance_label": instance_label}
+        )
 
     def _add_validation_error(self, result):
         self.publish_has_validation_errors = True
@@ -2481,6 +2682,8 @@ class PublisherController(BasePublisherController):
         )
 
     def _process_and_continue(self, plugin, instance):
+        # Plugin may change families of instances
+        self._publish_families = None
         result = pyblish.plugin.process(
             plugin, self._publish_context, instance
         )
@@ -2513,6 +2716,19 @@ class PublisherController(BasePublisherController):
         self._publish_next_process()
 
 
+def get_plugin_label(plugin):
+    """Label of publish plugin for UI.
+
+    Args:
+        plugin (pyblish.api.Plugin): Publish plugin.
+
+    Returns:
+        str: Plugin label or name of plugin class if label is not set.
+    """
+
+    return getattr(plugin, "label", None) or plugin.__name__
+
+
 def collect_families_from_instances(instances, only_active=False):
     """Collect all families for passed publish instances.
 
@@ -2527,15 +2743,13 @@ def collect_families_from_instances(instances, only_active=False):
 
     all_families = set()
     for instance in instances:
-        if only_active:
-            if instance.data.get("publish") is False:
-                continue
-        family = instance.data.get("family")
-        if family:
-            all_families.add(family)
-
-        families = instance.data.get("families") or tuple()
-        for family in families:
-            all_families.add(family)
-
+        instance_data = instance.data
+        if only_active and instance_data.get("publish") is False:
+            continue
+        all_families.add(instance_data.get("family"))
+        all_families.update(instance_data.get("families") or ())
+
+    # Remove empty family values
+    all_families.discard(None)
+    all_families.discard("")
     return list(all_families)
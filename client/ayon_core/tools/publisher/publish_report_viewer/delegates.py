@@ -1,3 +1,4 @@
+import math
 import collections
 from qtpy import QtWidgets, QtCore, QtGui
 from .constants import (
@@ -37,6 +38,32 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
     _item_border_size = 1.0 / 7.0
     _group_pix_offset_ratio = 1.0 / 3.0
     _group_pix_stroke_size_ratio = 1.0 / 7.0
+    # Icon names used for items by data roles in order of priority
+    _item_icon_name_by_role = (
+        (ITEM_ERRORED_ROLE, "error"),
+        (PLUGIN_SKIPPED_ROLE, "skipped"),
+        (PLUGIN_PASSED_ROLE, "passed"),
+        (INSTANCE_REMOVED_ROLE, "removed"),
+    )
+    # Names of class methods painting icons by icon name
+    _icon_paint_methods = {
+        "error": "_paint_error_icon",
+        "skipped": "_paint_skipped_icon",
+        "passed": "_paint_passed_icon",
+        "removed": "_paint_removed_icon",
+    }
+    # Elided labels are cached for all visible items and a few widths
+    _elided_labels_limit = 1000
+    # Background slices are cached for a few heights only (font change)
+    _group_bg_slices_limit = 20
+
+    def __init__(self, *args, **kwargs):
+        super(GroupItemDelegate, self).__init__(*args, **kwargs)
+        # Elided labels by label and width for font with key
+        self._elided_labels = {}
+        self._elided_labels_font_key = None
+        # Group background slices by height, state and device pixel ratio
+        self._group_bg_slices = {}
 
     @classmethod
     def _get_path_stroker(cls):
@@ -48,15 +75,27 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
             cls._path_stroker = path_stroker
         return cls._path_stroker
 
+    @staticmethod
+    def _create_icon_image(size):
+        """Create transparent image where icon is painted.
+
+        Icons are painted to image with raster paint engine and converted
+        to pixmap once.
+        """
+
+        size = int(size)
+        image = QtGui.QImage(
+            size, size, QtGui.QImage.Format_ARGB32_Premultiplied
+        )
+        image.fill(QtCore.Qt.transparent)
+        return image
+
     @classmethod
     def _get_plus_pixmap(cls, size):
-        pix = cls._minus_pixmaps.get(size)
+        pix = cls._plus_pixmaps.get(size)
         if pix is not None:
             return pix
 
-        pix = QtGui.QPixmap(size, size)
-        pix.fill(QtCore.Qt.transparent)
-
         offset = int(size * cls._group_pix_offset_ratio)
         pnt_1 = QtCore.QPoint(offset, int(size / 2))
         pnt_2 = QtCore.QPoint(size - offset, int(size / 2))
@@ -72,24 +111,23 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
         stroked_path_1 = path_stroker.createStroke(path_1)
         stroked_path_2 = path_stroker.createStroke(path_2)
 
-        pix = QtGui.QPixmap(size, size)
-        pix.fill(QtCore.Qt.transparent)
+        image = cls._create_icon_image(size)
 
-        painter = QtGui.QPainter(pix)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter = QtGui.QPainter(image)
         painter.setPen(QtCore.Qt.transparent)
         painter.setBrush(QtCore.Qt.white)
         painter.drawPath(stroked_path_1)
         painter.drawPath(stroked_path_2)
         painter.end()
 
-        cls._minus_pixmaps[size] = pix
+        pix = QtGui.QPixmap.fromImage(image)
+        cls._plus_pixmaps[size] = pix
 
         return pix
 
     @classmethod
     def _get_minus_pixmap(cls, size):
-        pix = cls._plus_pixmaps.get(size)
+        pix = cls._minus_pixmaps.get(size)
         if pix is not None:
             return pix
 
@@ -102,17 +140,16 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
         path_stroker.setWidth(size * cls._group_pix_stroke_size_ratio)
         stroked_path = path_stroker.createStroke(path)
 
-        pix = QtGui.QPixmap(size, size)
-        pix.fill(QtCore.Qt.transparent)
+        image = cls._create_icon_image(size)
 
-        painter = QtGui.QPainter(pix)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter = QtGui.QPainter(image)
         painter.setPen(QtCore.Qt.transparent)
         painter.setBrush(QtCore.Qt.white)
         painter.drawPath(stroked_path)
         painter.end()
 
-        cls._plus_pixmaps[size] = pix
+        pix = QtGui.QPixmap.fromImage(image)
+        cls._minus_pixmaps[size] = pix
 
         return pix
 
@@ -125,65 +162,187 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
     @classmethod
     def _get_icon(cls, name, size):
         icons_by_size = cls._item_icons_by_name_and_size[name]
-        if icons_by_size and size in icons_by_size:
-            return icons_by_size[size]
+        pix = icons_by_size.get(size)
+        if pix is not None:
+            return pix
+
+        paint_method_name = cls._icon_paint_methods.get(
+            name, "_paint_default_icon"
+        )
+        image = cls._create_icon_image(size)
+
+        painter = QtGui.QPainter(image)
+        getattr(cls, paint_method_name)(painter, size)
+        painter.end()
 
+        pix = QtGui.QPixmap.fromImage(image)
+        icons_by_size[size] = pix
+
+        return pix
+
+    @classmethod
+    def _paint_circle_icon(cls, painter, size, color):
         offset = int(size * cls._item_pix_offset_ratio)
         offset_size = size - (2 * offset)
-        pix = QtGui.QPixmap(size, size)
-        pix.fill(QtCore.Qt.transparent)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawEllipse(offset, offset, offset_size, offset_size)
 
-        painter = QtGui.QPainter(pix)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    @classmethod
+    def _paint_error_icon(cls, painter, size):
+        cls._paint_circle_icon(painter, size, QtGui.QColor(colors["error"]))
 
-        draw_ellipse = True
-        if name == "error":
-            color = QtGui.QColor(colors["error"])
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(color)
-
-        elif name == "skipped":
-            color = QtGui.QColor(QtCore.Qt.white)
-            pen = QtGui.QPen(color)
-            pen.setWidth(int(size * cls._item_border_size))
-            painter.setPen(pen)
-            painter.setBrush(QtCore.Qt.transparent)
-
-        elif name == "passed":
-            color = QtGui.QColor(colors["ok"])
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(color)
-
-        elif name == "removed":
-            draw_ellipse = False
-
-            offset = offset * 1.5
-            p1 = QtCore.QPoint(offset, offset)
-            p2 = QtCore.QPoint(size - offset, size - offset)
-            p3 = QtCore.QPoint(offset, size - offset)
-            p4 = QtCore.QPoint(size - offset, offset)
-
-            pen = QtGui.QPen(QtCore.Qt.white)
-            pen.setWidth(offset_size / 4)
-            pen.setCapStyle(QtCore.Qt.RoundCap)
-            painter.setPen(pen)
-            painter.setBrush(QtCore.Qt.transparent)
-            painter.drawLine(p1, p2)
-            painter.drawLine(p3, p4)
+    @classmethod
+    def _paint_passed_icon(cls, painter, size):
+        cls._paint_circle_icon(painter, size, QtGui.QColor(colors["ok"]))
 
-        else:
-            color = QtGui.QColor(QtCore.Qt.white)
-            painter.setPen(QtCore.Qt.NoPen)
-            painter.setBrush(color)
+    @classmethod
+    def _paint_default_icon(cls, painter, size):
+        cls._paint_circle_icon(painter, size, QtGui.QColor(QtCore.Qt.white))
 
-        if draw_ellipse:
-            painter.drawEllipse(offset, offset, offset_size, offset_size)
+    @classmethod
+    def _paint_skipped_icon(cls, painter, size):
+        offset = int(size * cls._item_pix_offset_ratio)
+        offset_size = size - (2 * offset)
+        pen = QtGui.QPen(QtGui.QColor(QtCore.Qt.white))
+        pen.setWidth(int(size * cls._item_border_size))
+        painter.setPen(pen)
+        painter.setBrush(QtCore.Qt.transparent)
+        painter.drawEllipse(offset, offset, offset_size, offset_size)
 
-        painter.end()
+    @classmethod
+    def _paint_removed_icon(cls, painter, size):
+        offset = int(size * cls._item_pix_offset_ratio)
+        offset_size = size - (2 * offset)
 
-        cls._item_icons_by_name_and_size[name][size] = pix
+        offset = offset * 1.5
+        p1 = QtCore.QPoint(offset, offset)
+        p2 = QtCore.QPoint(size - offset, size - offset)
+        p3 = QtCore.QPoint(offset, size - offset)
+        p4 = QtCore.QPoint(size - offset, offset)
+
+        pen = QtGui.QPen(QtCore.Qt.white)
+        pen.setWidth(offset_size / 4)
+        pen.setCapStyle(QtCore.Qt.RoundCap)
+        painter.setPen(pen)
+        painter.setBrush(QtCore.Qt.transparent)
+        painter.drawLine(p1, p2)
+        painter.drawLine(p3, p4)
+
+    def _get_elided_label(self, option, label, width):
+        font_key = option.font.key()
+        if font_key != self._elided_labels_font_key:
+            self._elided_labels_font_key = font_key
+            self._elided_labels = {}
+
+        key = (label, int(width))
+        elided_label = self._elided_labels.get(key)
+        if elided_label is None:
+            if len(self._elided_labels) >= self._elided_labels_limit:
+                self._elided_labels = {}
+            elided_label = option.fontMetrics.elidedText(
+                label, QtCore.Qt.ElideRight, width
+            )
+            self._elided_labels[key] = elided_label
+        return elided_label
+
+    def _get_group_bg_slices(self, height, state, ratio):
+        """Pre-rendered slices of group background.
+
+        Rounded background is rendered once per height, state and device
+        pixel ratio and split to left cap, center column and right cap. The
+        center column is stretched to width of a row on paint.
+
+        Args:
+            height (int): Height of background in device pixels.
+            state (str): Background state 'group', 'hover' or 'selected'.
+            ratio (float): Device pixel ratio.
+
+        Returns:
+            tuple[QtGui.QPixmap, QtGui.QPixmap, QtGui.QPixmap]: Left cap,
+                center column and right cap pixmaps.
+        """
 
-        return pix
+        key = (height, state, ratio)
+        slices = self._group_bg_slices.get(key)
+        if slices is not None:
+            return slices
+
+        if len(self._group_bg_slices) >= self._group_bg_slices_limit:
+            self._group_bg_slices = {}
+
+        cap_width = int(math.ceil(height / 2))
+        width = (cap_width * 2) + 1
+        image = QtGui.QImage(
+            width, height, QtGui.QImage.Format_ARGB32_Premultiplied
+        )
+        image.setDevicePixelRatio(ratio)
+        image.fill(QtCore.Qt.transparent)
+
+        bg_path = QtGui.QPainterPath()
+        radius = (height / ratio / 2) - 0.01
+        bg_path.addRoundedRect(
+            QtCore.QRectF(0, 0, width / ratio, height / ratio),
+            radius,
+            radius
+        )
+
+        painter = QtGui.QPainter(image)
+        painter.fillPath(bg_path, colors["group"])
+        if state != "group":
+            painter.fillPath(bg_path, colors[state])
+        painter.end()
+
+        slices = tuple(
+            QtGui.QPixmap.fromImage(image.copy(x, 0, slice_width, height))
+            for x, slice_width in (
+                (0, cap_width),
+                (cap_width, 1),
+                (cap_width + 1, cap_width),
+            )
+        )
+        for pix in slices:
+            pix.setDevicePixelRatio(ratio)
+        self._group_bg_slices[key] = slices
+        return slices
+
+    def _paint_group_bg(self, painter, rect, state):
+        ratio = painter.device().devicePixelRatioF()
+        height = int(math.ceil(rect.height() * ratio))
+        if height < 1:
+            return
+        left_pix, center_pix, right_pix = self._get_group_bg_slices(
+            height, state, ratio
+        )
+        cap_width = left_pix.width() / ratio
+        slice_height = height / ratio
+        left = rect.x()
+        top = rect.y()
+        center_width = max(rect.width() - (cap_width * 2), 0.0)
+
+        painter.drawPixmap(
+            QtCore.QRectF(left, top, cap_width, slice_height),
+            left_pix,
+            QtCore.QRectF(left_pix.rect())
+        )
+        if center_width:
+            painter.drawPixmap(
+                QtCore.QRectF(
+                    left + cap_width, top, center_width, slice_height
+                ),
+                center_pix,
+                QtCore.QRectF(center_pix.rect())
+            )
+        painter.drawPixmap(
+            QtCore.QRectF(
+                left + cap_width + center_width,
+                top,
+                cap_width,
+                slice_height
+            ),
+            right_pix,
+            QtCore.QRectF(right_pix.rect())
+        )
 
     def paint(self, painter, option, index):
         if index.data(ITEM_IS_GROUP_ROLE):
@@ -198,46 +357,39 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
         if widget:
             style = widget.style()
         else:
-            style = QtWidgets.QApplicaion.style()
+            style = QtWidgets.QApplication.style()
 
-        style.proxy().drawPrimitive(
+        style_proxy = style.proxy()
+        style_proxy.drawPrimitive(
             QtWidgets.QStyle.PE_PanelItemViewItem, option, painter, widget
         )
-        _rect = style.proxy().subElementRect(
+        _rect = style_proxy.subElementRect(
             QtWidgets.QStyle.SE_ItemViewItemText, option, widget
         )
-        bg_rect = QtCore.QRectF(option.rect)
-        bg_rect.setY(_rect.y())
-        bg_rect.setHeight(_rect.height())
-
-        expander_rect = QtCore.QRectF(bg_rect)
-        expander_rect.setWidth(expander_rect.height() + 5)
-
+        row_height = _rect.height()
+        expander_width = row_height + 5
+        expander_rect = QtCore.QRectF(
+            option.rect.x(), _rect.y(), expander_width, row_height
+        )
         label_rect = QtCore.QRectF(
-            expander_rect.x() + expander_rect.width(),
-            expander_rect.y(),
-            bg_rect.width() - expander_rect.width(),
-            expander_rect.height()
+            expander_rect.x() + expander_width,
+            _rect.y(),
+            option.rect.width() - expander_width,
+            row_height
         )
 
-        icon_size = expander_rect.height()
-        if index.data(ITEM_ERRORED_ROLE):
-            expander_icon = self._get_icon("error", icon_size)
-        elif index.data(PLUGIN_SKIPPED_ROLE):
-            expander_icon = self._get_icon("skipped", icon_size)
-        elif index.data(PLUGIN_PASSED_ROLE):
-            expander_icon = self._get_icon("passed", icon_size)
-        elif index.data(INSTANCE_REMOVED_ROLE):
-            expander_icon = self._get_icon("removed", icon_size)
-        else:
-            expander_icon = self._get_icon("", icon_size)
+        get_data = index.data
+        icon_name = ""
+        for role, role_icon_name in self._item_icon_name_by_role:
+            if get_data(role):
+                icon_name = role_icon_name
+                break
+        expander_icon = self._get_icon(icon_name, row_height)
 
-        label = index.data(QtCore.Qt.DisplayRole)
-        label = option.fontMetrics.elidedText(
-            label, QtCore.Qt.ElideRight, label_rect.width()
+        label = self._get_elided_label(
+            option, get_data(QtCore.Qt.DisplayRole), label_rect.width()
         )
 
-        painter.save()
         # Draw icon
         pix_point = QtCore.QPoint(
             expander_rect.center().x() - int(expander_icon.width() / 2),
@@ -246,11 +398,11 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
         painter.drawPixmap(pix_point, expander_icon)
 
         # Draw label
+        # - only font of painter is changed so only font is restored
+        painter_font = painter.font()
         painter.setFont(option.font)
         painter.drawText(label_rect, QtCore.Qt.AlignVCenter, label)
-
-        # Ok, we're done, tidy up.
-        painter.restore()
+        painter.setFont(painter_font)
 
     def group_item_paint(self, painter, option, index):
         """Paint text
@@ -263,7 +415,7 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
         if widget:
             style = widget.style()
         else:
-            style = QtWidgets.QApplicaion.style()
+            style = QtWidgets.QApplication.style()
         _rect = style.proxy().subElementRect(
             QtWidgets.QStyle.SE_ItemViewItemText, option, widget
         )
@@ -290,19 +442,13 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
             bg_rect.height()
         )
 
-        bg_path = QtGui.QPainterPath()
-        radius = (bg_rect.height() / 2) - 0.01
-        bg_path.addRoundedRect(bg_rect, radius, radius)
-
-        painter.fillPath(bg_path, colors["group"])
-
-        selected = option.state & QtWidgets.QStyle.State_Selected
-        hovered = option.state & QtWidgets.QStyle.State_MouseOver
-
-        if selected and hovered:
-            painter.fillPath(bg_path, colors["selected"])
-        elif hovered:
-            painter.fillPath(bg_path, colors["hover"])
+        bg_state = "group"
+        if option.state & QtWidgets.QStyle.State_MouseOver:
+            if option.state & QtWidgets.QStyle.State_Selected:
+                bg_state = "selected"
+            else:
+                bg_state = "hover"
+        self._paint_group_bg(painter, bg_rect, bg_state)
 
         expanded = self.parent().isExpanded(index)
         if expanded:
@@ -310,13 +456,10 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
         else:
             expander_icon = self._get_plus_pixmap(expander_height)
 
-        label = index.data(QtCore.Qt.DisplayRole)
-        label = option.fontMetrics.elidedText(
-            label, QtCore.Qt.ElideRight, label_rect.width()
+        label = self._get_elided_label(
+            option, index.data(QtCore.Qt.DisplayRole), label_rect.width()
         )
 
-        # Maintain reference to state, so we can restore it once we're done
-        painter.save()
         pix_point = QtCore.QPoint(
             expander_rect.center().x() - int(expander_icon.width() / 2),
             expander_rect.top()
@@ -324,8 +467,8 @@ class GroupItemDelegate(QtWidgets.QStyledItemDelegate):
         painter.drawPixmap(pix_point, expander_icon)
 
         # Draw label
+        # - only font of painter is changed so only font is restored
+        painter_font = painter.font()
         painter.setFont(option.font)
         painter.drawText(label_rect, QtCore.Qt.AlignVCenter, label)
-
-        # Ok, we're done, tidy up.
-        painter.restore()
+        painter.setFont(painter_font)
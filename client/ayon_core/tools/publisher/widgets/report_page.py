@@ -1723,9 +1723,10 @@ class ReportsWidget(QtWidgets.QWidget):
             plugin_id = plugin_info["id"]
             for instance_info in plugin_info["instances_data"]:
                 instance_id = instance_info["id"] or CONTEXT_ID
-                for log in instance_info["logs"]:
-                    log["plugin_id"] = plugin_id
-                logs_by_instance_id[instance_id].extend(instance_info["logs"])
+                logs_by_instance_id[instance_id].extend(
+                    dict(log, plugin_id=plugin_id)
+                    for log in instance_info["logs"]
+                )
 
         context_item = _InstanceItem.create_context_item(
             context_label, logs_by_instance_id[CONTEXT_ID])
@@ -1539,9 +1539,7 @@ class PublishPluginAttrsWidget(QtWidgets.QWidget):
         content_layout.addStretch(1)
 
         row = 0
-        for plugin_name, attr_defs, all_plugin_values in result:
-            plugin_values = all_plugin_values[plugin_name]
-
+        for plugin_name, attr_defs, plugin_values in result:
             for attr_def in attr_defs:
                 widget = create_widget_for_attr_def(
                     attr_def, content_widget
@@ -0,0 +1,186 @@
+import gc
+
+from ayon_core.lib.events import EventSystem
+
+
+def test_callbacks_order():
+    event_system = EventSystem()
+    calls = []
+
+    def first():
+        calls.append("first")
+
+    def second():
+        calls.append("second")
+
+    def third():
+        calls.append("third")
+
+    event_system.add_callback("test", third, order=200)
+    event_system.add_callback("test", first, order=10)
+    event_system.add_callback("test", second)
+
+    event_system.emit("test", {}, "test")
+    assert calls == ["first", "second", "third"]
+
+
+def test_callbacks_same_order_keep_registration_order():
+    event_system = EventSystem()
+    calls = []
+
+    def first():
+        calls.append("first")
+
+    def second():
+        calls.append("second")
+
+    event_system.add_callback("test", first)
+    event_system.add_callback("test", second)
+
+    event_system.emit("test", {}, "test")
+    assert calls == ["first", "second"]
+
+
+def test_order_change_after_emit():
+    event_system = EventSystem()
+    calls = []
+
+    def first():
+        calls.append("first")
+
+    def second():
+        calls.append("second")
+
+    event_system.add_callback("test", first, order=10)
+    second_callback = event_system.add_callback("test", second, order=20)
+    event_system.emit("test", {}, "test")
+
+    second_callback.set_order(0)
+    calls.clear()
+    event_system.emit("test", {}, "test")
+    assert calls == ["second", "first"]
+
+
+def test_order_change_does_not_affect_other_system():
+    event_system = EventSystem()
+    other_event_system = EventSystem()
+
+    def callback():
+        pass
+
+    event_system.add_callback("test", callback)
+    other_callback = other_event_system.add_callback("test", callback)
+    event_system.emit("test", {}, "test")
+    other_event_system.emit("test", {}, "test")
+
+    cached_callbacks = event_system._callbacks_by_topic["test"]
+    other_callback.set_order(0)
+    assert event_system._callbacks_by_topic["test"] is cached_callbacks
+    assert "test" not in other_event_system._callbacks_by_topic
+
+
+def test_callback_added_after_emit_is_called():
+    event_system = EventSystem()
+    calls = []
+
+    def first():
+        calls.append("first")
+
+    def second():
+        calls.append("second")
+
+    event_system.add_callback("test", first)
+    event_system.emit("test", {}, "test")
+
+    event_system.add_callback("test", second)
+    calls.clear()
+    event_system.emit("test", {}, "test")
+    assert calls == ["first", "second"]
+
+
+def test_wildcard_topic():
+    event_system = EventSystem()
+    topics = []
+
+    def callback(event):
+        topics.append(event.topic)
+
+    event_system.add_callback("test.*", callback)
+    event_system.emit("test.started", {}, "test")
+    event_system.emit("other.started", {}, "test")
+    event_system.emit("test.finished", {}, "test")
+    assert topics == ["test.started", "test.finished"]
+
+
+def test_deregistered_callback_is_removed():
+    event_system = EventSystem()
+    calls = []
+
+    def callback():
+        calls.append("callback")
+
+    registered_callback = event_system.add_callback("test", callback)
+    registered_callback.deregister()
+    event_system.emit("test", {}, "test")
+
+    assert calls == []
+    assert registered_callback not in event_system._registered_callbacks
+
+
+def test_garbage_collected_callback_is_removed():
+    event_system = EventSystem()
+
+    def callback():
+        pass
+
+    registered_callback = event_system.add_callback("test", callback)
+    del callback
+    gc.collect()
+
+    event_system.emit("other", {}, "test")
+    assert registered_callback not in event_system._registered_callbacks
+
+
+def test_deregister_and_add_callback_during_emit():
+    event_system = EventSystem()
+    calls = []
+    callbacks = {}
+
+    def first():
+        calls.append("first")
+        callbacks["second"].deregister()
+        event_system.add_callback("test", third)
+
+    def second():
+        calls.append("second")
+
+    def third():
+        calls.append("third")
+
+    event_system.add_callback("test", first, order=10)
+    callbacks["second"] = event_system.add_callback(
+        "test", second, order=20
+    )
+
+    event_system.emit("test", {}, "test")
+    assert calls == ["first"]
+
+    calls.clear()
+    event_system.emit("test", {}, "test")
+    assert calls == ["first", "third"]
+
+
+def test_topics_cache_is_limited():
+    event_system = EventSystem()
+
+    def callback():
+        pass
+
+    event_system.add_callback("*", callback)
+    for idx in range(event_system.callbacks_cache_limit * 2):
+        event_system.emit("test.{}".format(idx), {}, "test")
+
+    assert (
+        len(event_system._callbacks_by_topic)
+        <= event_system.callbacks_cache_limit
+    )